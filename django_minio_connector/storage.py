@@ -1,16 +1,220 @@
 # django_minio_connector/storage.py
 
+import functools
 import json
 import mimetypes
 import os
 from datetime import timedelta
-from random import randrange
-
+import secrets
+import threading
+import weakref
+from time import monotonic
+from urllib.parse import quote, urlunsplit
+
+import certifi
+import urllib3
 from django.conf import settings
 from django.core.files import File
 from django.core.files.storage import Storage
 from django.utils import timezone
 from minio import Minio
+from minio.deleteobjects import DeleteObject
+from minio.error import S3Error
+from minio.signer import presign_v4
+from minio.time import utcnow
+
+
+# Pooled urllib3 transports shared by every Minio client talking to the same
+# endpoint, so worker threads reuse warm TCP/TLS connections instead of
+# opening and discarding one per request.
+_pool_managers = {}
+_pool_managers_lock = threading.Lock()
+
+# Guards creation of the per-object-name locks used to coalesce concurrent
+# stat_object calls for the same key into a single network request.
+_stat_lock_guard = threading.Lock()
+
+# Minio clients shared by every storage instance with the same network
+# identity, so repeated MinIOStorage construction reuses one client (and its
+# pooled transport) instead of building a new one each time.
+_minio_clients = {}
+_minio_clients_lock = threading.Lock()
+
+# Buckets already checked/created/configured by this process, so bucket
+# bootstrap costs one round-trip per bucket instead of one per storage
+# instantiation (management commands, autoreload, per-field storages).
+_initialized_buckets = set()
+_initialized_buckets_lock = threading.Lock()
+
+# Bucket regions resolved once per process and shared by sibling storage
+# instances, so presigning never has to ask the server where a bucket lives.
+_bucket_regions = {}
+_bucket_regions_lock = threading.Lock()
+
+# Stat caches shared by every storage instance talking to the same bucket, so
+# cache warmth survives Django re-instantiating the storage per request.
+_stat_caches = {}
+_stat_caches_lock = threading.Lock()
+
+
+def _get_stat_cache(endpoint, bucket_name, maxsize, ttl):
+    """
+    Returns the shared stat cache for the given bucket, creating and caching
+    it on first use.
+
+    Args:
+        endpoint (str): MinIO service URL the bucket lives on.
+        bucket_name (str): Name of the bucket whose metadata is cached.
+        maxsize (int): Maximum number of entries kept in the cache.
+        ttl (float): Lifetime of an entry in seconds.
+
+    Returns:
+        _TTLCache: The cache shared by storage instances of this bucket.
+    """
+    key = (endpoint, bucket_name)
+    with _stat_caches_lock:
+        cache = _stat_caches.get(key)
+        if cache is None:
+            cache = _TTLCache(maxsize=maxsize, ttl=ttl)
+            _stat_caches[key] = cache
+    return cache
+
+
+@functools.lru_cache(maxsize=512)
+def _guess_type_by_ext(ext):
+    """
+    Returns the MIME type for a file extension, memoized per extension.
+
+    The MIME type of an object depends only on its suffix, so the result of
+    the full mimetypes.guess_type machinery is cached and repeated uploads
+    with the same extension cost a single dict lookup.
+
+    Args:
+        ext (str): Lower-cased file extension including the dot, or ''.
+
+    Returns:
+        str: The guessed MIME type, or None if the extension is unknown.
+    """
+    return mimetypes.types_map.get(ext) or mimetypes.guess_type('x' + ext)[0]
+
+
+def _get_pool_manager(endpoint, secure, cert_check, maxsize):
+    """
+    Returns the shared urllib3.PoolManager for the given endpoint, creating
+    and caching it on first use.
+
+    Args:
+        endpoint (str): MinIO service URL the pool connects to.
+        secure (bool): Whether the endpoint is reached over TLS.
+        cert_check (bool): Whether server certificates are verified.
+        maxsize (int): Maximum number of pooled connections per host.
+
+    Returns:
+        urllib3.PoolManager: The transport shared by clients of this endpoint.
+    """
+    key = (endpoint, secure, cert_check)
+    with _pool_managers_lock:
+        pool = _pool_managers.get(key)
+        if pool is None:
+            pool = urllib3.PoolManager(
+                num_pools=10,
+                maxsize=maxsize,
+                block=False,
+                timeout=urllib3.Timeout(connect=5, read=30),
+                retries=urllib3.Retry(
+                    total=3,
+                    backoff_factor=0.2,
+                    status_forcelist=[500, 502, 503, 504],
+                ),
+                cert_reqs='CERT_REQUIRED' if cert_check else 'CERT_NONE',
+                # Load CA certificates the same way minio-py's default client
+                # does, so TLS keeps verifying on hosts where only certifi
+                # bundles the trust store.
+                ca_certs=os.environ.get('SSL_CERT_FILE') or certifi.where(),
+            )
+            _pool_managers[key] = pool
+    return pool
+
+
+class _TTLCache:
+    """
+    A minimal size-capped mapping whose entries expire after a time-to-live.
+
+    Entries expire 'ttl' seconds after they were last stored or, when
+    'refresh_on_access' is True, last read. When the cache is full, expired
+    entries are dropped first and then the least recently used entry is
+    evicted to make room.
+
+    Args:
+        maxsize (int): Maximum number of entries kept in the cache.
+        ttl (float): Lifetime of an entry in seconds.
+        refresh_on_access (bool): If True, reading an entry resets its
+            time-to-live. Defaults to True.
+    """
+
+    def __init__(self, maxsize, ttl, refresh_on_access=True):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.refresh_on_access = refresh_on_access
+        self._entries = {}  # key -> (expires_at, value)
+
+    def get(self, key, default=None):
+        """
+        Returns the cached value for 'key', or 'default' if the key is absent
+        or its entry has expired. A hit moves the entry to the most recently
+        used position and, if 'refresh_on_access' is set, resets its ttl.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        now = monotonic()
+        if expires_at <= now:
+            return default
+        if self.refresh_on_access:
+            expires_at = now + self.ttl
+        self._entries[key] = (expires_at, value)
+        return value
+
+    def pop(self, key, default=None):
+        """
+        Removes 'key' from the cache and returns its value, or 'default' if
+        the key is absent or its entry has expired.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None or entry[0] <= monotonic():
+            return default
+        return entry[1]
+
+    def __setitem__(self, key, value):
+        entries = self._entries
+        entries.pop(key, None)
+        now = monotonic()
+        if len(entries) >= self.maxsize:
+            # Drop expired entries first, then fall back to the oldest ones.
+            for stale in [k for k, (expires_at, _) in entries.items() if expires_at <= now]:
+                del entries[stale]
+            while len(entries) >= self.maxsize:
+                del entries[next(iter(entries))]
+        entries[key] = (now + self.ttl, value)
+
+
+def _close_and_release(response):
+    """
+    Closes a urllib3 response and then returns its connection to the pool.
+
+    minio's documented cleanup order is close() followed by release_conn():
+    releasing a partially-read response without closing it first would hand a
+    dirty connection back to the shared pool and break the next request that
+    reuses it.
+
+    Args:
+        response: The urllib3 response object to clean up.
+    """
+    try:
+        response.close()
+    finally:
+        response.release_conn()
 
 
 class MinioStorageFile(File):
@@ -18,27 +222,58 @@ class MinioStorageFile(File):
     Class representing a file stored in Minio storage.
 
     This class extends the base File class and provides additional methods to interact
-    with files stored in Minio storage.
+    with files stored in Minio storage. The pooled HTTP connection backing the
+    file is guaranteed to be released exactly once, even when close() is never
+    called and the object is only garbage collected.
 
     Attributes:
         Parent class attributes
 
     Methods:
         close(): Close the file and release the connection to Minio storage.
+        chunks(): Stream the file content and release the connection afterwards.
     """
 
+    def __init__(self, file, name=None):
+        """
+        Wraps the urllib3 response returned by the Minio client and registers
+        a finalizer returning its connection to the pool.
+
+        :param file: the urllib3 response object holding the file content
+        :param name: the name of the file (default is None)
+        """
+        super(MinioStorageFile, self).__init__(file, name)
+        # weakref.finalize guarantees the close-then-release cleanup runs at
+        # most once, either explicitly via close()/chunks() or at garbage
+        # collection, so a forgotten close() can no longer pin a connection in
+        # the pool (nor return a half-read one to it).
+        self._finalizer = weakref.finalize(self, _close_and_release, file)
+
     def close(self):
         """
         Closes the file and releases the connection to Minio storage.
 
-        This method first calls the parent class's close method to perform any necessary cleanup,
-        then it calls the 'release_conn' method on the 'file' attribute to close the connection
-        to Minio storage.
+        This method first closes the underlying response and returns its
+        connection to the pool via the registered finalizer, then it calls the
+        parent class's close method to perform any necessary cleanup.
 
         :return: None
         """
+        self._finalizer()
         super(MinioStorageFile, self).close()
-        self.file.release_conn()
+
+    def chunks(self, chunk_size=64 * 1024):
+        """
+        Streams the file content in chunks, then closes the response and
+        releases the connection once the stream is exhausted or abandoned.
+
+        :param chunk_size: the number of bytes read per chunk (default is 64 KiB)
+        :return: generator yielding bytes chunks of the file content
+        """
+        try:
+            yield from self.file.stream(chunk_size)
+        finally:
+            self._finalizer()
 
 
 class MinIOStorage(Storage):
@@ -62,7 +297,18 @@ class MinIOStorage(Storage):
     CERT_CHECK (bool): Enable/Disable server certificate verification , defaults to True.
     MINIO_BUCKET_POLICY (dict): Bucket policy for MinIO bucket, default to None.
     MINIO_PRESIGNED_URL (bool): If True, use pre-signed URLs instead of public URLs, default to True.
+    MINIO_PRESIGNED_EXPIRATION (datetime.timedelta): Lifetime of pre-signed URLs, default to 1 day.
+    MINIO_PRESIGN_QUANTUM (int): Seconds the pre-sign timestamp is floored to, so calls within the same quantum produce identical URLs; 0 disables quantization, default to 60.
     MINIO_OVERWRITE_FILES (bool): If False, avoid overwriting files, default to False.
+    MINIO_STRICT_UNIQUE (bool): If True, verify with the server that a name is free before saving, default to False.
+    MINIO_STAT_CACHE_ENABLED (bool): If True, cache object metadata returned by the server, default to False.
+    MINIO_STAT_CACHE_TTL (int): Lifetime in seconds of cached object metadata, default to 300.
+    MINIO_STAT_CACHE_SIZE (int): Maximum number of metadata entries kept in the cache, default to 1024.
+    MINIO_NEGATIVE_CACHE_TTL (int): Seconds exists() remembers that a file is missing; 0 disables the negative cache, default to 0.
+    MINIO_POOL_MAXSIZE (int): Maximum number of pooled HTTP connections per MinIO host, default to 64.
+    MINIO_MULTIPART_THRESHOLD (int): File size in bytes above which uploads stream in parallel parts, default to 64 MiB.
+    MINIO_MULTIPART_PART_SIZE (int): Part size in bytes for multipart uploads, default to 16 MiB.
+    MINIO_MULTIPART_WORKERS (int): Number of parts uploaded in parallel, default to 4.
 
     """
 
@@ -87,7 +333,18 @@ class MinIOStorage(Storage):
         CERT_CHECK (bool): Enable/Disable server certificate verification , defaults to True.
         MINIO_BUCKET_POLICY (dict): Bucket policy for MinIO bucket, default to None.
         MINIO_PRESIGNED_URL (bool): If True, use pre-signed URLs instead of public URLs, default to True.
+        MINIO_PRESIGNED_EXPIRATION (datetime.timedelta): Lifetime of pre-signed URLs, default to 1 day.
+        MINIO_PRESIGN_QUANTUM (int): Seconds the pre-sign timestamp is floored to, so calls within the same quantum produce identical URLs; 0 disables quantization, default to 60.
         MINIO_OVERWRITE_FILES (bool): If False, avoid overwriting files, default to False.
+        MINIO_STRICT_UNIQUE (bool): If True, verify with the server that a name is free before saving, default to False.
+        MINIO_STAT_CACHE_ENABLED (bool): If True, cache object metadata returned by the server, default to False.
+        MINIO_STAT_CACHE_TTL (int): Lifetime in seconds of cached object metadata, default to 300.
+        MINIO_STAT_CACHE_SIZE (int): Maximum number of metadata entries kept in the cache, default to 1024.
+        MINIO_NEGATIVE_CACHE_TTL (int): Seconds exists() remembers that a file is missing; 0 disables the negative cache, default to 0.
+        MINIO_POOL_MAXSIZE (int): Maximum number of pooled HTTP connections per MinIO host, default to 64.
+        MINIO_MULTIPART_THRESHOLD (int): File size in bytes above which uploads stream in parallel parts, default to 64 MiB.
+        MINIO_MULTIPART_PART_SIZE (int): Part size in bytes for multipart uploads, default to 16 MiB.
+        MINIO_MULTIPART_WORKERS (int): Number of parts uploaded in parallel, default to 4.
 
         """
         self.endpoint = kwargs['MINIO_ENDPOINT']
@@ -102,17 +359,84 @@ class MinIOStorage(Storage):
         self.credentials = kwargs.get('CREDENTIALS', None)  # Provider
         self.cert_check = kwargs.get('CERT_CHECK', True)  # Provider
 
+        # Precomputed scheme://host/bucket/ prefix for the public-URL branch
+        # of url(), so hot render paths only pay for quoting the name.
+        self._public_prefix = f'{"https://" if self.secure else "http://"}{self.endpoint}/{self.bucket_name}/'
+
         self.bucket_policy = kwargs.get('MINIO_BUCKET_POLICY', None)
         self.pre_signed_url = kwargs.get('MINIO_PRESIGNED_URL', True)
+        self.presigned_expiration = kwargs.get('MINIO_PRESIGNED_EXPIRATION', timedelta(days=1))
+        self.presign_quantum = kwargs.get('MINIO_PRESIGN_QUANTUM', 60)
         self.overwrite_files = kwargs.get('MINIO_OVERWRITE_FILES', False)
+        self.strict_unique = kwargs.get('MINIO_STRICT_UNIQUE', False)
+
+        self.pool_maxsize = kwargs.get('MINIO_POOL_MAXSIZE', 64)
+        self.multipart_threshold = kwargs.get('MINIO_MULTIPART_THRESHOLD', 64 * 1024 * 1024)
+        self.multipart_part_size = kwargs.get('MINIO_MULTIPART_PART_SIZE', 16 * 1024 * 1024)
+        self.multipart_workers = kwargs.get('MINIO_MULTIPART_WORKERS', 4)
+
+        self.stat_cache_enabled = kwargs.get('MINIO_STAT_CACHE_ENABLED', False)
+        self.stat_cache_ttl = kwargs.get('MINIO_STAT_CACHE_TTL', 300)
+        self.stat_cache_size = kwargs.get('MINIO_STAT_CACHE_SIZE', 1024)
+        self._stat_cache = _get_stat_cache(
+            self.endpoint, self.bucket_name, self.stat_cache_size, self.stat_cache_ttl,
+        )
+        self._stat_locks = weakref.WeakValueDictionary()
+        # Optional negative cache so repeated existence probes for the same
+        # missing key skip the round-trip. Like the stat cache it is off by
+        # default, since a remembered "missing" can mask an upload made by
+        # another worker for up to its ttl.
+        self.negative_cache_ttl = kwargs.get('MINIO_NEGATIVE_CACHE_TTL', 0)
+        self._missing_cache = (
+            _TTLCache(maxsize=1024, ttl=self.negative_cache_ttl, refresh_on_access=False)
+            if self.negative_cache_ttl > 0 else None
+        )
+        # Pre-signed URLs stay valid for presigned_expiration, so identical
+        # URLs can be served from cache. Quantizing the request date backdates
+        # a signature by up to one quantum, so the ttl is budgeted against the
+        # worst-case remaining validity at caching time (5 minutes less, or
+        # 90% of it for short expirations) -- a cached URL can never outlive
+        # its signature.
+        expiration_seconds = self.presigned_expiration.total_seconds()
+        remaining_seconds = expiration_seconds - self._effective_quantum(expiration_seconds)
+        if remaining_seconds > 600:
+            url_cache_ttl = remaining_seconds - 300
+        else:
+            url_cache_ttl = max(1, remaining_seconds * 0.9)
+        self._url_cache = _TTLCache(
+            maxsize=4096,
+            ttl=url_cache_ttl,
+            refresh_on_access=False,
+        )
 
-        self.minio_client = self._get_minio_client()
+        # Snapshot of settings.USE_TZ so hot metadata accessors skip Django's
+        # LazySettings attribute lookup on every call.
+        self._use_tz = bool(settings.USE_TZ)
 
-        if not self.minio_client.bucket_exists(self.bucket_name):
-            self.minio_client.make_bucket(self.bucket_name)
+        self.minio_client = self._get_minio_client()
 
-        if self.bucket_policy:
-            self.minio_client.set_bucket_policy(self.bucket_name, json.dumps(self.bucket_policy))
+        bucket_key = (self.endpoint, self.bucket_name)
+        if bucket_key not in _initialized_buckets:
+            with _initialized_buckets_lock:
+                if bucket_key not in _initialized_buckets:
+                    if not self.minio_client.bucket_exists(self.bucket_name):
+                        self.minio_client.make_bucket(self.bucket_name)
+
+                    if self.bucket_policy:
+                        self.minio_client.set_bucket_policy(self.bucket_name, json.dumps(self.bucket_policy))
+
+                    _initialized_buckets.add(bucket_key)
+
+        # Resolve the bucket region once, so the first presign in a cold
+        # worker does not trigger a GetBucketLocation round-trip; sibling
+        # instances of the same bucket reuse the memoized answer.
+        if self.region is None:
+            region = _bucket_regions.get(bucket_key)
+            if region is None:
+                region = self.minio_client._get_region(self.bucket_name)
+                with _bucket_regions_lock:
+                    _bucket_regions[bucket_key] = region
+            self.region = region
 
     def _get_minio_client(self):
         """
@@ -121,6 +445,13 @@ class MinIOStorage(Storage):
 
             The client is configured using the instance variables: endpoint, access_key,
             secret_key, secure, session_token, region, http_client, credentials and cert_check.
+            When no pre-configured http_client or credentials are supplied, the client is
+            shared across storage instances through a module-level table keyed on the
+            endpoint, the full credential material (access key, secret key, session
+            token), scheme, region and certificate check, so repeated MinIOStorage
+            construction does not rebuild it while rotated secrets or fresh STS tokens
+            always get their own client. Pre-configured http_client/credentials objects
+            are identity-bearing and opt the instance out of sharing.
 
             Returns:
                 minio.Minio: An instance of a Minio client. This client has been configured
@@ -128,6 +459,36 @@ class MinIOStorage(Storage):
                              MinIOStorage class and is ready for making operations against
                              the MinIO server.
             """
+        if self.http_client is not None or self.credentials is not None:
+            return self._build_minio_client()
+
+        key = (
+            self.endpoint,
+            self.access_key,
+            self.secret_key,
+            self.session_token or '',
+            self.secure,
+            self.region or '',
+            self.cert_check,
+        )
+        with _minio_clients_lock:
+            client = _minio_clients.get(key)
+            if client is None:
+                client = self._build_minio_client()
+                _minio_clients[key] = client
+        return client
+
+    def _build_minio_client(self):
+        """
+            Constructs a new MinIO client from the instance configuration,
+            attaching the shared pooled transport when none was supplied.
+
+            Returns:
+                minio.Minio: A freshly constructed Minio client.
+            """
+        http_client = self.http_client
+        if http_client is None:
+            http_client = _get_pool_manager(self.endpoint, self.secure, self.cert_check, self.pool_maxsize)
         return Minio(
             endpoint=self.endpoint,
             access_key=self.access_key,
@@ -135,7 +496,7 @@ class MinIOStorage(Storage):
             secure=self.secure,
             session_token=self.session_token,
             region=self.region,
-            http_client=self.http_client,
+            http_client=http_client,
             credentials=self.credentials,
             cert_check=self.cert_check
         )
@@ -165,6 +526,11 @@ class MinIOStorage(Storage):
         a new name is generated, otherwise the file is overwritten.
         Django has self system for checking if a file exists.
 
+        Files larger than MINIO_MULTIPART_THRESHOLD (or whose size is unknown)
+        are streamed to the server in MINIO_MULTIPART_PART_SIZE parts with
+        MINIO_MULTIPART_WORKERS parallel uploads; smaller files are sent as a
+        single PUT as before.
+
         Args:
             name (str): The name of the file to save.
             content (BinaryIO): the content of the file to save.
@@ -172,21 +538,52 @@ class MinIOStorage(Storage):
         Returns:
             str: The final name under which the content file was saved.
         """
-        if self.exists(name) and not self.overwrite_files:
+        if self.strict_unique and not self.overwrite_files and self.exists(name):
             name = self.get_available_name(name)
 
-        content.seek(0)
+        # The key is about to exist; forget any cached negative answer.
+        if self._missing_cache is not None:
+            self._missing_cache.pop(name, None)
 
-        # Guess the mimetype of your file
-        content_type = mimetypes.guess_type(name)[0]
+        # Only rewind when the stream is not already at the start; some File
+        # subclasses flush buffers or reopen temporary files on seek().
+        try:
+            position = content.tell()
+        except (AttributeError, OSError):
+            position = None
+        if position:
+            content.seek(0)
+
+        # Guess the mimetype of your file; fall back to the full name for
+        # compound extensions (e.g. '.tar.gz') the single suffix misses.
+        content_type = (_guess_type_by_ext(os.path.splitext(name)[1].lower())
+                        or mimetypes.guess_type(name)[0])
+
+        size = getattr(content, 'size', None)
+        if size is None or size > self.multipart_threshold:
+            # Unknown or large size: let minio-py stream the upload in
+            # parallel multipart chunks instead of one monolithic PUT.
+            self.minio_client.put_object(
+                self.bucket_name,
+                name,
+                content,
+                length=-1,
+                part_size=self.multipart_part_size,
+                num_parallel_uploads=self.multipart_workers,
+                content_type=content_type,
+            )
+        else:
+            self.minio_client.put_object(
+                self.bucket_name,
+                name,
+                content,
+                size,
+                content_type=content_type,  # Add the content_type here
+            )
 
-        self.minio_client.put_object(
-            self.bucket_name,
-            name,
-            content,
-            content.size,
-            content_type=content_type,  # Add the content_type here
-        )
+        # The cached metadata and URL (if any) are stale after an upload.
+        self._stat_cache.pop(name, None)
+        self._url_cache.pop(name, None)
 
         return name
 
@@ -201,6 +598,33 @@ class MinIOStorage(Storage):
             name (str): The name of the file to delete.
         """
         self.minio_client.remove_object(self.bucket_name, name)
+        self._stat_cache.pop(name, None)
+        self._url_cache.pop(name, None)
+
+    def delete_many(self, names):
+        """
+        Deletes several files from the MinIO storage in bulk.
+
+        A single DeleteObjects request handles up to 1000 keys, so removing a
+        batch of files costs one round-trip instead of one remove_object call
+        per name. Cached metadata and URLs for the deleted names are dropped.
+
+        Args:
+            names (iterable): The names of the files to delete.
+
+        Returns:
+            list: DeleteError instances for names the server failed to delete;
+            empty if every deletion succeeded.
+        """
+        names = list(names)
+        errors = list(self.minio_client.remove_objects(
+            self.bucket_name,
+            (DeleteObject(name) for name in names),
+        ))
+        for name in names:
+            self._stat_cache.pop(name, None)
+            self._url_cache.pop(name, None)
+        return errors
 
     def exists(self, name):
         """
@@ -208,7 +632,15 @@ class MinIOStorage(Storage):
 
         This method uses the MinIO client to retrieve the meta-data of an object
         identified by its name. If the object exists, stat_object raises no
-        exception and the method returns True, otherwise False.
+        exception and the method returns True; if the server answers that the
+        key does not exist, it returns False. Any other error (timeouts, TLS
+        failures, 5xx responses) propagates to the caller instead of being
+        mistaken for a missing file.
+
+        When MINIO_NEGATIVE_CACHE_TTL is set, a "not found" answer is
+        remembered for that many seconds, so repeated checks for the same
+        missing key do not each cost a network round-trip. Saving the file
+        through this storage clears the remembered answer.
 
         Args:
             name (str): The name of the file to check for its existence.
@@ -216,11 +648,21 @@ class MinIOStorage(Storage):
         Returns:
             bool: True if the file exists in MinIO storage; False otherwise.
         """
+        if self.stat_cache_enabled and self._stat_cache.get(name) is not None:
+            return True
+        if self._missing_cache is not None and self._missing_cache.get(name):
+            return False
         try:
             self.get_stat(name)
             return True
-        except (Exception,):
-            return False
+        except S3Error as error:
+            # Only a genuine "no such key" means the file is missing;
+            # anything else is a real failure and must not be swallowed.
+            if error.code == 'NoSuchKey':
+                if self._missing_cache is not None:
+                    self._missing_cache[name] = True
+                return False
+            raise
 
     def get_accessed_time(self, name):
         """
@@ -240,24 +682,15 @@ class MinIOStorage(Storage):
             MinioException: An error occurred in retrieving the time.
         """
         time = self.get_stat(name).last_modified
-        if not settings.USE_TZ:
+        if not self._use_tz:
             time = timezone.make_naive(time)
         return time
 
-    def get_created_time(self, name):
-        """
-        Returns the creation time of the file with a given name from the MinIO storage.
-
-        This method utilizes the `get_accessed_time` method to fetch the creation time of a file.
-
-        Args:
-            name (str): The name of the file whose creation time is to be retrieved.
-
-        Returns:
-            datetime.datetime: A datetime object showing the creation time of the file.
-            If the Django setting USE_TZ is True, the time is made aware by the Django timezone.
-        """
-        return self.get_accessed_time(name)
+    # MinIO only tracks last_modified, so the created/modified accessors are
+    # straight aliases of get_accessed_time; aliasing at class scope avoids an
+    # extra Python frame per call in loops that print several timestamps.
+    get_created_time = get_accessed_time
+    get_modified_time = get_accessed_time
 
     def get_stat(self, name):
         """
@@ -266,6 +699,13 @@ class MinIOStorage(Storage):
         This method uses MinIO client's `stat_object` method to retrieve the metadata
         of a file identified by its name.
 
+        When MINIO_STAT_CACHE_ENABLED is set, the metadata is served from a
+        size-capped cache for MINIO_STAT_CACHE_TTL seconds; a cache hit resets
+        the entry's time-to-live. The cached entry is invalidated whenever the
+        file is saved or deleted through this storage. Concurrent misses for
+        the same name are coalesced behind a per-name lock, so only one thread
+        performs the network call and the others reuse its result.
+
         Args:
             name (str): The name of the file whose metadata is to be retrieved.
 
@@ -275,12 +715,40 @@ class MinIOStorage(Storage):
         Raises:
             MinioException: An error occurred while retrieving the metadata.
         """
-        return self.minio_client.stat_object(self.bucket_name, name)
+        if not self.stat_cache_enabled:
+            return self.minio_client.stat_object(self.bucket_name, name)
+
+        stat = self._stat_cache.get(name)
+        if stat is not None:
+            return stat
+
+        with _stat_lock_guard:
+            lock = self._stat_locks.get(name)
+            if lock is None:
+                lock = threading.Lock()
+                self._stat_locks[name] = lock
+
+        with lock:
+            # Double-check: a concurrent thread may have populated the cache
+            # while this one was waiting for the lock.
+            stat = self._stat_cache.get(name)
+            if stat is None:
+                stat = self.minio_client.stat_object(self.bucket_name, name)
+                self._stat_cache[name] = stat
+        return stat
 
     def get_available_name(self, name, max_length=1024):
         """
-        Given a file name, this function appends an underscore and a random number to the name
-        until a unique name is generated.
+        Given a file name, this function returns it unchanged when it is free
+        to use, and otherwise appends an underscore and a random suffix.
+
+        Django routes every Storage.save() through this method, so a name
+        that fits and is not taken (or that the storage is allowed to
+        overwrite) must come back untouched -- renaming here would give
+        collectstatic assets and overwritten files a different name on every
+        save. Only a genuine collision gets the suffix; it carries 64 bits of
+        entropy, so a single suffixed attempt is free with overwhelming
+        probability and no retry loop is needed.
 
         Note: If the file name exceeds max_length, it's truncated to fit.
 
@@ -291,22 +759,18 @@ class MinIOStorage(Storage):
         Returns:
             name (str): The name modified to assure it's unique and doesn't exceed max_length.
         """
+        fits = not max_length or len(name) <= max_length
+        if fits and (self.overwrite_files or not self.exists(name)):
+            return name
 
-        # If the filename already exists, add an underscore and a number (before the file extension, if one exists)
-        # to the filename until the generated filename doesn't exist.
-        while self.exists(name) or (max_length and len(name) > max_length):
-            # file_ext includes the dot.
-            filename, file_ext = os.path.splitext(name)
+        # file_ext includes the dot.
+        filename, file_ext = os.path.splitext(name)
 
-            # Truncate filename to max_length
-            if max_length:
-                # Subtract one to allow for underscore
-                filename = filename[:max_length - len(file_ext) - 1]
+        # Truncate filename so the underscore and the 16-character suffix fit.
+        if max_length:
+            filename = filename[:max_length - len(file_ext) - 17]
 
-            # name = get_valid_filename("%s_%s%s" % (filename, randrange(100, 999), file_ext))
-            name = "%s_%s%s" % (filename, randrange(100, 999), file_ext)
-
-        return name
+        return "%s_%s%s" % (filename, secrets.token_hex(8), file_ext)
 
     def url(self, name):
         """
@@ -319,17 +783,123 @@ class MinIOStorage(Storage):
         Args:
             name (str): Name of the file in the Minio server for which the URL is to be generated
 
+        Pre-signed URLs are cached until shortly before their signature
+        expires, so repeated renders of the same object do not re-sign it.
+        Saving or deleting the file invalidates the cached URL.
+
         Returns:
             str: A string representing the URL at which the file's content is accessible.
         """
         if self.pre_signed_url:
-            url = self.minio_client.get_presigned_url(
-                "GET", self.bucket_name, name, expires=timedelta(days=1),
-            )
+            url = self._url_cache.get(name)
+            if url is None:
+                url = self.minio_client.get_presigned_url(
+                    "GET", self.bucket_name, name, expires=self.presigned_expiration,
+                    request_date=self._presign_date(self.presigned_expiration),
+                )
+                self._url_cache[name] = url
         else:
-            url = f'{"https://" if self.secure else "http://"}{self.endpoint}/{self.bucket_name}/{name}'
+            url = self._public_prefix + quote(name, safe='/')
         return url
 
+    def _effective_quantum(self, expires_seconds):
+        """
+        Returns the presign quantum actually applied for a signature lifetime.
+
+        The configured MINIO_PRESIGN_QUANTUM is clamped to half the signature
+        lifetime -- a short expiration must never be consumed by the flooring
+        skew -- and a non-positive setting disables quantization entirely.
+
+        Args:
+            expires_seconds (float): Lifetime in seconds of the signature.
+
+        Returns:
+            int: The clamped quantum in seconds; 0 means no quantization.
+        """
+        if self.presign_quantum <= 0:
+            return 0
+        return min(self.presign_quantum, int(expires_seconds) // 2 or 1)
+
+    def _presign_date(self, expires):
+        """
+        Returns the current UTC time floored to the presign quantum.
+
+        Because the request date is embedded in the SigV4 signature, two
+        presign computations with the same floored date produce identical
+        URLs; quantizing makes repeated renders within the quantum
+        deterministic and cache-friendly. The quantum is clamped by
+        _effective_quantum, and disabling quantization yields the plain
+        current time.
+
+        Args:
+            expires (datetime.timedelta): Lifetime of the signature the date
+                is used for.
+
+        Returns:
+            datetime.datetime: The quantized, timezone-aware request date.
+        """
+        quantum = self._effective_quantum(expires.total_seconds())
+        now = utcnow().replace(microsecond=0)
+        if quantum <= 1:
+            return now
+        return now - timedelta(seconds=int(now.timestamp()) % quantum)
+
+    def urls(self, names, expires=None):
+        """
+        Returns URLs for several files in one pass.
+
+        Presigning is a purely local SigV4 computation once the bucket region
+        is known, so the per-call scaffolding of get_presigned_url (region
+        resolution, credential retrieval, expiry validation) is hoisted out of
+        the loop and each name only pays for building and signing its own URL.
+        After the one-off region lookup, no network round-trip is made.
+
+        Args:
+            names (iterable): Names of the files for which URLs are generated.
+            expires (datetime.timedelta, optional): Lifetime of the pre-signed
+                URLs. Defaults to MINIO_PRESIGNED_EXPIRATION, matching url().
+
+        Returns:
+            list: URL strings, in the same order as 'names'.
+        """
+        if not self.pre_signed_url:
+            return [self.url(name) for name in names]
+
+        expires = expires or self.presigned_expiration
+        # Only batches signed with the default expiration may share the URL
+        # cache; its ttl is derived from that expiration.
+        cacheable = expires == self.presigned_expiration
+        expires_seconds = int(expires.total_seconds())
+        client = self.minio_client
+        region = client._get_region(self.bucket_name)
+        credentials = client._provider.retrieve() if client._provider else None
+        query_params = {}
+        if credentials and credentials.session_token:
+            query_params["X-Amz-Security-Token"] = credentials.session_token
+        date = self._presign_date(expires)
+
+        urls = []
+        for name in names:
+            if cacheable:
+                cached = self._url_cache.get(name)
+                if cached is not None:
+                    urls.append(cached)
+                    continue
+            url = client._base_url.build(
+                "GET",
+                region,
+                bucket_name=self.bucket_name,
+                object_name=name,
+                query_params=dict(query_params),
+            )
+            if credentials:
+                url = presign_v4("GET", url, region, credentials, date, expires_seconds)
+            url = urlunsplit(url)
+            if cacheable:
+                self._url_cache[name] = url
+            urls.append(url)
+        return urls
+
     def listdir(self, path):
         """
         Lists all the files located in a given directory on the MinIO storage server.
@@ -337,23 +907,25 @@ class MinIOStorage(Storage):
         This method uses MinIO client's `list_objects` method to retrieve the list of all
         files located in the directory specified by 'path'.
 
+        The listing already carries each object's size and last-modified time,
+        so when the stat cache is enabled those entries are stored into it;
+        subsequent size() or get_accessed_time() calls on listed names are
+        then answered without another request per object.
+
         Args:
             path (str): The directory whose files are to be listed.
 
         Returns:
-            list_objects_v2: An iterable object over Object along with additional metadata for each object returned as
-            ListObjectsV2Result.
+            list: Object instances along with additional metadata for each object found under 'path'.
         """
-        return self.minio_client.list_objects(
-            self.bucket_name,
-            prefix=path,
-            recursive=False,
-            start_after=None,
-            include_user_meta=False,
-            include_version=False,
-            use_api_v1=False,
-            use_url_encoding_type=True
-        )
+        objects = list(self.minio_client.list_objects(self.bucket_name, prefix=path, recursive=False))
+
+        if self.stat_cache_enabled:
+            for obj in objects:
+                if not obj.is_dir:
+                    self._stat_cache[obj.object_name] = obj
+
+        return objects
 
     def size(self, name):
         """